@@ -1,15 +1,15 @@
 import gettext
-import json
+import re
 import sys
 
+from dataclasses import dataclass
 from pathlib import Path
-from queue import Empty, Queue
-from threading import Event
 
 import yt_dlp
 
 from PySide6 import QtCore, QtGui, QtWidgets
-from PySide6.QtUiTools import QUiLoader
+
+from .uic import loadUi
 
 
 _PATH = Path(__file__).resolve().parent
@@ -21,20 +21,89 @@ AUDIO_QUALITIES = (0, 2, 5, 8)
 VIDEO_CONTAINERS = ("mp4", "mkv", "3gp", "flv", "webm")
 VIDEO_RESOLUTIONS = (2160, 1440, 1080, 720, 480)
 
+_URL_RE = re.compile(r"^https?://\S+$")
+
+_AUDIO_OPTS = tuple(
+    {
+        "format": f"{codec}/bestaudio/best",
+        "postprocessors": [
+            {
+                "key": "FFmpegExtractAudio",
+                "preferredcodec": codec,
+                "preferredquality": quality,
+            }
+        ],
+    }
+    for codec in AUDIO_CODECS
+    for quality in AUDIO_QUALITIES
+)
+_VIDEO_OPTS = tuple(
+    {
+        "format": (
+            f"{container}[height={resolution}]+"
+            f"{'m4a' if container == 'mp4' else 'bestaudio'}/"
+            f"bestvideo[height<={resolution}]+bestaudio"
+        )
+    }
+    for container in VIDEO_CONTAINERS
+    for resolution in VIDEO_RESOLUTIONS
+)
+
+
+@dataclass(slots=True, frozen=True)
+class UiSnapshot:
+    audio_only: bool
+    audio_format_index: int
+    audio_quality_index: int
+    video_format_index: int
+    video_resolution_index: int
+    own_format: str
+    output_path: str
+    output_name: str
+
 
-try:
-    translation = gettext.translation("yt-dlp-qt", localedir=LOCALES)
-    if translation:
-        translation.install()
+def build_options(snapshot: UiSnapshot) -> dict:
+    if snapshot.audio_only:
+        index = (
+            snapshot.audio_format_index * len(AUDIO_QUALITIES)
+            + snapshot.audio_quality_index
+        )
+        options = _AUDIO_OPTS[index].copy()
+    else:
+        index = (
+            snapshot.video_format_index * len(VIDEO_RESOLUTIONS)
+            + snapshot.video_resolution_index
+        )
+        options = _VIDEO_OPTS[index].copy()
+    if snapshot.own_format:
+        options["format"] = snapshot.own_format
+    options["paths"] = {"home": snapshot.output_path}
+    options["outtmpl"] = {"default": snapshot.output_name}
+    return options
+
+
+def _load_catalog():
+    global _, ngt
+    try:
+        translation = gettext.translation("yt-dlp-qt", localedir=LOCALES)
         _ = translation.gettext
         ngt = translation.ngettext
-except FileNotFoundError:
-    _ = gettext.gettext
-    ngt = gettext.ngettext
+    except FileNotFoundError:
+        _ = gettext.gettext
+        ngt = gettext.ngettext
+
+
+def _(message: str) -> str:
+    _load_catalog()
+    return _(message)
 
 
-ABOUT = _(
-    """\
+def ngt(singular: str, plural: str, n: int) -> str:
+    _load_catalog()
+    return ngt(singular, plural, n)
+
+
+ABOUT = """\
 <b>GUI-Frontend for yt-dlp</b><br>
 <br>
 Only some of yt-dlp's options are available.<br>
@@ -43,95 +112,72 @@ Only some of yt-dlp's options are available.<br>
 <b>Icon by AmruID</b>:
 <a href="https://de.freepik.com/icon/spielen_10885035">Freepik</a><br>
 """
-)
 
 
-class UiLoaderError(Exception):
-    pass
+_ICON_CACHE: QtGui.QIcon | None = None
 
 
-class UiLoader(QUiLoader):
+def _app_icon() -> QtGui.QIcon:
+    global _ICON_CACHE
+    if _ICON_CACHE is None:
+        _ICON_CACHE = QtGui.QIcon(str(ICON))
+    return _ICON_CACHE
 
-    def __init__(self, base, custom_widgets=None):
-        QUiLoader.__init__(self, base)
-        self.base = base
-        self.custom_widgets = custom_widgets
 
-    def createWidget(self, class_name, parent=None, name=""):
-        if parent is None and self.base:
-            return self.base
-        else:
-            if class_name in self.availableWidgets():
-                widget = QUiLoader.createWidget(self, class_name, parent, name)
-            else:
-                try:
-                    widget = self.custom_widgets[class_name](parent)
-                except (TypeError, KeyError):
-                    raise UiLoaderError(
-                        _('No custom widget "{class_name}" found.').format(
-                            class_name=class_name
-                        )
-                    )
-            if self.base:
-                setattr(self.base, name, widget)
-            return widget
-
-
-def loadUi(ui_file, base=None, custom_widgets=None, working_directory=None):
-    loader = UiLoader(base, custom_widgets)
-    if working_directory is not None:
-        loader.setWorkingDirectory(working_directory)
-    if not isinstance(ui_file, str):
-        ui_file = str(ui_file)
-    widget = loader.load(ui_file)
-    QtCore.QMetaObject.connectSlotsByName(widget)
-    return widget
-
-
-class Worker(QtCore.QThread):
+class DownloadSignals(QtCore.QObject):
     started = QtCore.Signal(str)
     finished = QtCore.Signal(str)
     progress = QtCore.Signal(int)
 
-    def __init__(self, queue: Queue, shutdown: Event):
+
+class DownloadJob(QtCore.QRunnable):
+
+    def __init__(self, url: str, options: dict):
         super().__init__()
-        self.queue = queue
-        self.shutdown = shutdown
+        self.url = url
+        self.options = options
+        self.signals = DownloadSignals()
+        self._last_pct = -1
 
     def run(self):
-        while not self.shutdown.is_set():
-            try:
-                url, options = self.queue.get(timeout=1.5)
-                self._download(url, options)
-            except Empty:
-                pass
+        self.options["progress_hooks"] = [self._progress]
+        with yt_dlp.YoutubeDL(self.options) as ydl:
+            info = ydl.extract_info(self.url, download=False)
+            title = info.get("title", _("unknown title"))
+            self.signals.started.emit(title)
+            if info.get("entries") is not None:
+                for entry in info["entries"]:
+                    if entry:
+                        ydl.process_ie_result(entry, download=True)
+            else:
+                ydl.process_ie_result(info, download=True)
+        self.signals.finished.emit(title)
 
     def _progress(self, info: dict):
         if info["status"] == "downloading":
-            try:
-                progress = info["downloaded_bytes"] / info["total_bytes"]
-                self.progress.emit(int(progress * 100))
-            except Exception as error:
-                print(error)
+            total = info.get("total_bytes") or info.get(
+                "total_bytes_estimate"
+            )
+            if not total:
+                return
+            pct = info["downloaded_bytes"] * 100 // int(total)
+            if pct > 100:
+                pct = 100
+            if pct != self._last_pct:
+                self._last_pct = pct
+                self.signals.progress.emit(pct)
         elif info["status"] == "finished":
-            self.progress.emit(100)
-
-    def _download(self, url: str, options: dict):
-        options["progress_hooks"] = [self._progress]
-        with yt_dlp.YoutubeDL(options) as ydl:
-            info = ydl.extract_info(url, download=False)
-            title = info.get("title", _("unknown title"))
-            self.started.emit(title)
-            ydl.download([url])
-        self.finished.emit(title)
+            self._last_pct = -1
+            self.signals.progress.emit(100)
 
 
 class YtDlpQt(QtWidgets.QMainWindow):
 
     def __init__(self, parent: QtWidgets.QWidget | None = None):
         super().__init__(parent)
-        loadUi(UI_FILE, base=self)
-        self.setWindowIcon(QtGui.QIcon(str(ICON)))
+        loadUi(UI_FILE, base=self, gettext_func=_)
+        self._app = QtWidgets.QApplication.instance()
+        self.setWindowIcon(_app_icon())
         self.config = QtCore.QSettings("Whitie", "yt-dlp-qt")
         self.tray = None
         self.last_url = ""
@@ -146,21 +192,29 @@ class YtDlpQt(QtWidgets.QMainWindow):
         self.menubar.addMenu(self.helpmenu)
         self.status = self.statusBar()
         self.clipboard = QtWidgets.QApplication.clipboard()
-        self.clipboard.dataChanged.connect(self.check_clipboard)
+        self._clipboard_connected = False
+        self.monitor_clipboard.stateChanged.connect(
+            self._toggle_clipboard_monitor
+        )
         self.action_quit.triggered.connect(self._quit)
         self.action_help.triggered.connect(self._help)
         self.browse.clicked.connect(self.set_download_location)
         self.download.clicked.connect(self.start_download)
         self.audio_only.stateChanged.connect(self._only_audio)
-        self.url.textChanged.connect(self._check_url)
-        self.queue = Queue()
-        self.shutdown = Event()
-        self.worker = Worker(self.queue, self.shutdown)
-        self.worker.started.connect(self.download_started)
-        self.worker.finished.connect(self.download_finished)
-        self.worker.progress.connect(self.download_progress)
-        self.worker.start()
+        self._download_enabled = None
+        self._url_debounce = QtCore.QTimer(self)
+        self._url_debounce.setSingleShot(True)
+        self._url_debounce.setInterval(50)
+        self._url_debounce.timeout.connect(self._check_url)
+        self.url.textChanged.connect(
+            lambda text: self._url_debounce.start()
+        )
+        self.pool = QtCore.QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(
+            self.config.value("downloads/parallel", 2, type=int)
+        )
         self._only_audio()
+        self._toggle_clipboard_monitor()
         self._check_url()
         self._translate()
         self.tabs.setCurrentIndex(0)
@@ -168,11 +222,8 @@ class YtDlpQt(QtWidgets.QMainWindow):
     def _quit(self):
         self.dump_config()
         self.hide()
-        self.shutdown.set()
-        self.worker.wait()
-        self.worker.quit()
-        app = QtWidgets.QApplication.instance()
-        app.quit()
+        self.pool.waitForDone()
+        self._app.quit()
 
     def _help(self):
         QtWidgets.QMessageBox.about(self, _("About YT-DLP-QT"), _(ABOUT))
@@ -220,18 +271,36 @@ class YtDlpQt(QtWidgets.QMainWindow):
         self.download.setToolTip(_("Start downloading now..."))
 
     def _only_audio(self, state: int | None = None):
-        self.video_resolution.setDisabled(self.audio_only.isChecked())
-        self.video_format.setDisabled(self.audio_only.isChecked())
+        checked = self.audio_only.isChecked()
+        self.video_resolution.setDisabled(checked)
+        self.video_format.setDisabled(checked)
+
+    def _toggle_clipboard_monitor(self, state: int | None = None):
+        checked = self.monitor_clipboard.isChecked()
+        if checked == self._clipboard_connected:
+            return
+        if checked:
+            self.clipboard.dataChanged.connect(self.check_clipboard)
+        else:
+            self.clipboard.dataChanged.disconnect(self.check_clipboard)
+        self._clipboard_connected = checked
 
-    def _check_url(self, text: str = ""):
-        self.download.setEnabled(bool(text.strip()))
+    def _check_url(self):
+        enabled = bool(self.url.text().strip())
+        if enabled != self._download_enabled:
+            self._download_enabled = enabled
+            self.download.setEnabled(enabled)
 
     def check_clipboard(self):
-        if self.monitor_clipboard.isChecked():
-            if text := self.clipboard.text().strip():
-                if "://" in text and text != self.last_url:
-                    self.last_url = text
-                    self.url.setText(text)
+        if not self.monitor_clipboard.isChecked():
+            return
+        text = self.clipboard.text()
+        if not text or len(text) > 2048 or "://" not in text:
+            return
+        text = text.strip()
+        if text != self.last_url and _URL_RE.match(text):
+            self.last_url = text
+            self.url.setText(text)
 
     def set_download_location(self):
         folder = QtWidgets.QFileDialog.getExistingDirectory(
@@ -247,7 +316,17 @@ class YtDlpQt(QtWidgets.QMainWindow):
         url = self.url.text().strip()
         if not url:
             return
-        self.queue.put((url, self.get_ytdlp_options()))
+        job = DownloadJob(url, build_options(self._snapshot()))
+        job.signals.started.connect(
+            self.download_started, QtCore.Qt.QueuedConnection
+        )
+        job.signals.finished.connect(
+            self.download_finished, QtCore.Qt.QueuedConnection
+        )
+        job.signals.progress.connect(
+            self.download_progress, QtCore.Qt.QueuedConnection
+        )
+        self.pool.start(job)
 
     def download_started(self, title: str):
         self.tray.showMessage(
@@ -267,60 +346,33 @@ class YtDlpQt(QtWidgets.QMainWindow):
     def download_progress(self, progress: int):
         self.progress.setValue(progress)
 
-    def get_ytdlp_options(self) -> dict:
-        if self.audio_only.isChecked():
-            options = self._get_audio_options()
-        else:
-            options = self._get_video_options()
-        if text := self.own_format.text().strip():
-            options["format"] = text
-        options["paths"] = {"home": self.output_path.text()}
-        options["outtmpl"] = {"default": self.output_name.text()}
-        return options
-
-    def _get_audio_options(self):
-        codec = AUDIO_CODECS[self.audio_format.currentIndex()]
-        quality = AUDIO_QUALITIES[self.audio_quality.currentIndex()]
-        return {
-            "format": f"{codec}/bestaudio/best",
-            "postprocessors": [
-                {
-                    "key": "FFmpegExtractAudio",
-                    "preferredcodec": codec,
-                    "preferredquality": quality,
-                }
-            ],
-        }
-
-    def _get_video_options(self):
-        container = VIDEO_CONTAINERS[self.video_format.currentIndex()]
-        resolution = VIDEO_RESOLUTIONS[self.video_resolution.currentIndex()]
-        if container == "mp4":
-            audio_codec = "m4a"
-        else:
-            audio_codec = "bestaudio"
-        return {
-            "format": (
-                f"{container}[height={resolution}]+{audio_codec}/"
-                f"bestvideo[height<={resolution}]+bestaudio"
-            )
-        }
+    def _snapshot(self) -> UiSnapshot:
+        return UiSnapshot(
+            audio_only=self.audio_only.isChecked(),
+            audio_format_index=self.audio_format.currentIndex(),
+            audio_quality_index=self.audio_quality.currentIndex(),
+            video_format_index=self.video_format.currentIndex(),
+            video_resolution_index=self.video_resolution.currentIndex(),
+            own_format=self.own_format.text().strip(),
+            output_path=self.output_path.text(),
+            output_name=self.output_name.text(),
+        )
 
     def apply_config(self):
         self.video_resolution.setCurrentIndex(
-            int(self.config.value("video/resolution", 2))
+            self.config.value("video/resolution", 2, type=int)
         )
         self.video_format.setCurrentIndex(
-            int(self.config.value("video/format", 0))
+            self.config.value("video/format", 0, type=int)
         )
         self.audio_quality.setCurrentIndex(
-            int(self.config.value("audio/quality", 0))
+            self.config.value("audio/quality", 0, type=int)
         )
         self.audio_format.setCurrentIndex(
-            int(self.config.value("audio/format", 0))
+            self.config.value("audio/format", 0, type=int)
         )
         self.audio_only.setChecked(
-            _bool(self.config.value("audio/only", False))
+            self.config.value("audio/only", False, type=bool)
         )
         self.output_path.setText(
             self.config.value("output/path", _get_download_location())
@@ -329,48 +381,43 @@ class YtDlpQt(QtWidgets.QMainWindow):
             self.config.value("output/name", "%(title)s.%(ext)s")
         )
         self.monitor_clipboard.setChecked(
-            _bool(self.config.value("clipboard/monitor", False))
+            self.config.value("clipboard/monitor", False, type=bool)
         )
         self.own_format.setText(self.config.value("expert/format", ""))
         self.setGeometry(
-            int(self.config.value("window/x", 0)),
-            int(self.config.value("window/y", 0)),
-            int(self.config.value("window/width", 440)),
-            int(self.config.value("window/height", 440)),
+            self.config.value("window/x", 0, type=int),
+            self.config.value("window/y", 0, type=int),
+            self.config.value("window/width", 440, type=int),
+            self.config.value("window/height", 440, type=int),
         )
         self.last_url = self.config.value("url/last", "")
+        self._cfg_snapshot = self._config_values()
+
+    def _config_values(self) -> dict:
+        return {
+            "video/resolution": self.video_resolution.currentIndex(),
+            "video/format": self.video_format.currentIndex(),
+            "audio/quality": self.audio_quality.currentIndex(),
+            "audio/format": self.audio_format.currentIndex(),
+            "audio/only": self.audio_only.isChecked(),
+            "output/path": self.output_path.text(),
+            "output/name": self.output_name.text(),
+            "clipboard/monitor": self.monitor_clipboard.isChecked(),
+            "expert/format": self.own_format.text(),
+            "window/x": self.x(),
+            "window/y": self.y(),
+            "window/width": self.width(),
+            "window/height": self.height(),
+            "url/last": self.last_url,
+        }
 
     def dump_config(self):
-        self.config.setValue(
-            "video/resolution", self.video_resolution.currentIndex()
-        )
-        self.config.setValue("video/format", self.video_format.currentIndex())
-        self.config.setValue(
-            "audio/quality", self.audio_quality.currentIndex()
-        )
-        self.config.setValue("audio/format", self.audio_format.currentIndex())
-        self.config.setValue("audio/only", self.audio_only.isChecked())
-        self.config.setValue("output/path", self.output_path.text())
-        self.config.setValue("output/name", self.output_name.text())
-        self.config.setValue(
-            "clipboard/monitor", self.monitor_clipboard.isChecked()
-        )
-        self.config.setValue("expert/format", self.own_format.text())
-        self.config.setValue("window/x", self.x())
-        self.config.setValue("window/y", self.y())
-        self.config.setValue("window/width", self.width())
-        self.config.setValue("window/height", self.height())
-        self.config.setValue("url/last", self.last_url)
+        for key, value in self._config_values().items():
+            if self._cfg_snapshot.get(key) != value:
+                self.config.setValue(key, value)
         self.config.sync()
 
 
-def _bool(value: str) -> bool:
-    try:
-        return json.loads(value)
-    except json.JSONDecodeError:
-        return value == "true"
-
-
 def _get_download_location() -> str:
     path = Path.home() / "Downloads"
     if path.is_dir():
@@ -383,8 +430,7 @@ def main():
     window = YtDlpQt()
     if QtWidgets.QSystemTrayIcon.isSystemTrayAvailable():
         app.setQuitOnLastWindowClosed(False)
-        icon = QtGui.QIcon(str(ICON))
-        tray = QtWidgets.QSystemTrayIcon(icon)
+        tray = QtWidgets.QSystemTrayIcon(_app_icon())
         tray.setVisible(True)
         menu = QtWidgets.QMenu()
         action_show = QtGui.QAction(_("Show Window"))
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from PySide6 import QtCore
+from PySide6.QtUiTools import QUiLoader
+
+
+_UI_CACHE: dict[str, bytes] = {}
+
+
+class UiLoaderError(Exception):
+    pass
+
+
+class UiLoader(QUiLoader):
+
+    def __init__(self, base, custom_widgets=None, gettext_func=None):
+        QUiLoader.__init__(self, base)
+        self.base = base
+        self.custom_widgets = custom_widgets
+        self.gettext = gettext_func or (lambda msg: msg)
+        self._available = frozenset(self.availableWidgets())
+
+    def createWidget(self, class_name, parent=None, name=""):
+        if parent is None and self.base:
+            return self.base
+        else:
+            if class_name in self._available:
+                widget = QUiLoader.createWidget(self, class_name, parent, name)
+            else:
+                try:
+                    widget = self.custom_widgets[class_name](parent)
+                except (TypeError, KeyError):
+                    raise UiLoaderError(
+                        self.gettext(
+                            'No custom widget "{class_name}" found.'
+                        ).format(class_name=class_name)
+                    )
+            if self.base:
+                setattr(self.base, name, widget)
+            return widget
+
+
+def loadUi(
+    ui_file,
+    base=None,
+    custom_widgets=None,
+    working_directory=None,
+    gettext_func=None,
+):
+    loader = UiLoader(base, custom_widgets, gettext_func)
+    if working_directory is not None:
+        loader.setWorkingDirectory(working_directory)
+    if not isinstance(ui_file, str):
+        ui_file = str(ui_file)
+    if ui_file not in _UI_CACHE:
+        _UI_CACHE[ui_file] = Path(ui_file).read_bytes()
+    buffer = QtCore.QBuffer()
+    buffer.setData(_UI_CACHE[ui_file])
+    buffer.open(QtCore.QIODevice.ReadOnly)
+    widget = loader.load(buffer)
+    QtCore.QMetaObject.connectSlotsByName(widget)
+    return widget